@@ -0,0 +1,7 @@
+"""
+Python tooling around the BiteCode Judge0 deployment.
+
+Everything in here reads its problems and testcases from the same
+``judge0-frontend/src/data/problems.json`` the React app uses, so the load
+generator and the local stand-in exercise exactly what students submit.
+"""
@@ -0,0 +1,97 @@
+# judge0_tools/client.py
+"""Thin `requests` wrapper around the Judge0 submissions API."""
+import os
+import time
+
+import requests
+
+DEFAULT_URL = os.environ.get("JUDGE0_URL", "http://104.236.56.159:2358")
+
+# Statuses that mean "not finished yet"
+PENDING_STATUS_IDS = (1, 2)
+
+# Judge0 CE's MAX_SUBMISSION_BATCH_SIZE default
+MAX_BATCH_SIZE = 20
+
+
+def _fields(fields):
+    """Query params asking Judge0 for `fields` (a list) instead of its default attributes."""
+    return {"fields": ",".join(fields)} if fields else {}
+
+
+class Judge0Error(Exception):
+    """Judge0 could not be reached or did not finish a submission in time."""
+
+
+class Judge0Client:
+    """
+    Talks to one Judge0 instance.
+
+    A `requests.Session` is not safe to share between threads, so concurrent
+    callers should each build their own client.
+    """
+
+    def __init__(self, base_url=DEFAULT_URL, timeout=30, session=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def _post(self, path, payload, **params):
+        params.setdefault("base64_encoded", "false")
+        r = self.session.post(f"{self.base_url}{path}", params=params, json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def _get(self, path, **params):
+        params.setdefault("base64_encoded", "false")
+        r = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def languages(self):
+        return self._get("/languages")
+
+    def submit_wait(self, payload, fields=None):
+        """POST /submissions?wait=true and return the finished submission."""
+        return self._post("/submissions/", payload, wait="true", **_fields(fields))
+
+    def submit(self, payload):
+        """POST /submissions?wait=false and return the token."""
+        return self._post("/submissions/", payload, wait="false")["token"]
+
+    def get(self, token, fields=None):
+        return self._get(f"/submissions/{token}", **_fields(fields))
+
+    def submit_batch(self, payloads):
+        """POST /submissions/batch and return one token per payload, in order."""
+        created = self._post("/submissions/batch", {"submissions": payloads})
+        tokens = []
+        for item in created:
+            if "token" not in item:
+                raise Judge0Error(f"Judge0 rejected a batch submission: {item}")
+            tokens.append(item["token"])
+        return tokens
+
+    def get_batch(self, tokens, fields=None):
+        """GET /submissions/batch?tokens=... and return the submissions, in order."""
+        reply = self._get("/submissions/batch", tokens=",".join(tokens), **_fields(fields))
+        if not isinstance(reply, dict) or not isinstance(reply.get("submissions"), list):
+            raise Judge0Error(f"Unexpected batch reply from Judge0: {reply!r:.200}")
+        return reply["submissions"]
+
+    def wait_for(self, token, poll_interval=0.25, max_wait=60, fields=None):
+        """
+        Poll GET /submissions/{token} until it leaves In Queue / Processing.
+
+        Returns ``(result, polls)`` so callers can see how chatty polling was.
+        """
+        deadline = time.monotonic() + max_wait
+        polls = 0
+        while True:
+            result = self.get(token, fields)
+            polls += 1
+            if result.get("status", {}).get("id") not in PENDING_STATUS_IDS:
+                return result, polls
+            if time.monotonic() >= deadline:
+                raise Judge0Error(f"Submission {token} still pending after {max_wait}s")
+            time.sleep(poll_interval)
@@ -0,0 +1,444 @@
+# judge0_tools/compare.py
+"""
+Streaming, tolerance-aware output comparison.
+
+`tests/test_judge0.py` and the frontend decide correctness with
+``stdout.strip() == expected`` or `splitlines()`, which holds both outputs
+(and their normalised copies) in memory at once. `compare` instead walks
+both outputs chunk by chunk, stops at the first difference and reports
+exactly where it is.
+
+Rules (see `RULES`, extend with `register_rule`):
+
+- ``exact``      – character for character.
+- ``whitespace`` – the frontend's `normalize`: trailing whitespace on each
+  line and leading/trailing blank space of the whole output are ignored.
+- ``token``      – whitespace-separated tokens must match; how they are
+  separated does not matter.
+- ``float``      – like ``token``, but numeric tokens match when they are
+  within `epsilon` (absolute or relative) of the expected value.
+
+Either side can be a string, a file object opened in text mode, or any
+iterable of string chunks::
+
+    with open("expected.txt") as exp, open("actual.txt") as out:
+        mismatch = compare(exp, out, rule="float", epsilon=1e-6)
+    if mismatch:
+        print(mismatch["line"], mismatch["column"], mismatch["reason"])
+
+``python -m judge0_tools.compare --bench`` benchmarks every rule on large
+synthetic outputs against the materialise-and-strip approach.
+"""
+import argparse
+import itertools
+import json
+import math
+import re
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from pathlib import Path
+
+CHUNK_SIZE = 64 * 1024
+SNIPPET = 32
+_TOKEN = re.compile(r"\S+")
+
+RULES = {}
+
+
+def register_rule(name):
+    """Register ``fn(expected_chunks, actual_chunks, **options)`` as a comparison rule."""
+    def decorator(fn):
+        RULES[name] = fn
+        return fn
+    return decorator
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    """Yield non-empty string chunks from a str, a text file object or an iterable of str."""
+    if source is None:
+        return
+    if isinstance(source, str):
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def compare(expected, actual, rule="whitespace", chunk_size=CHUNK_SIZE, **options):
+    """
+    Compare `actual` against `expected` with `rule`.
+
+    Returns None when they match, otherwise a dict describing the first
+    mismatch: ``rule``, ``line`` and ``column`` (1-based, in `actual`),
+    ``offset`` (0-based character offset in `actual`), the ``expected`` and
+    ``got`` text around it and a human-readable ``reason``.
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unknown comparison rule {rule!r}; expected one of {sorted(RULES)}")
+    mismatch = RULES[rule](iter_chunks(expected, chunk_size), iter_chunks(actual, chunk_size), **options)
+    if mismatch is not None:
+        mismatch["rule"] = rule
+    return mismatch
+
+
+def _mismatch(line, column, offset, expected, got, reason):
+    return {"line": line, "column": column, "offset": offset,
+            "expected": expected, "got": got, "reason": reason}
+
+
+# ---- exact ---------------------------------------------------------------
+
+def _common_prefix(a, b):
+    """Length of the common prefix of two strings."""
+    n = min(len(a), len(b))
+    if a[:n] == b[:n]:
+        return n
+    return _first_difference(a[:n], b[:n])
+
+
+def _first_difference(a, b):
+    """Index of the first differing character of two equal-length strings."""
+    lo, hi = 0, len(a)
+    while hi - lo > 1:  # bisect on slice equality: C-speed compares instead of a Python loop
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _snippet(head, chunks):
+    """Up to SNIPPET characters starting with `head`, reading ahead in `chunks` if needed."""
+    parts, size = [head], len(head)
+    while size < SNIPPET:
+        chunk = next(chunks, "")
+        if not chunk:
+            break
+        parts.append(chunk)
+        size += len(chunk)
+    return "".join(parts)[:SNIPPET]
+
+
+@register_rule("exact")
+def _exact(expected, actual):
+    e = a = ""
+    offset = 0
+    line, line_start = 1, 0
+    while True:
+        if not e:
+            e = next(expected, "")
+        if not a:
+            a = next(actual, "")
+        if not e or not a:
+            break
+        n = min(len(e), len(a))
+        x, y = e[:n], a[:n]
+        if x != y:
+            i = _first_difference(x, y)
+            line += x.count("\n", 0, i)
+            nl = x.rfind("\n", 0, i)
+            column = i - nl if nl >= 0 else offset + i - line_start + 1
+            return _mismatch(line, column, offset + i, _snippet(e[i:i + SNIPPET], expected),
+                             _snippet(a[i:i + SNIPPET], actual), "outputs differ")
+        newlines = x.count("\n")
+        if newlines:
+            line += newlines
+            line_start = offset + x.rfind("\n") + 1
+        offset += n
+        e, a = e[n:], a[n:]
+    if e or a:
+        column = offset - line_start + 1
+        if e:
+            return _mismatch(line, column, offset, _snippet(e[:SNIPPET], expected), "", "output ends early")
+        return _mismatch(line, column, offset, "", _snippet(a[:SNIPPET], actual), "extra output")
+    return None
+
+
+# ---- whitespace / token / float ----------------------------------------
+#
+# These rules compare *items* (lines or tokens). Each chunk is split into
+# complete items with C-level str.split(); whole batches are compared with
+# list equality, and only a batch that differs is walked item by item. Where
+# an item sits in the output is worked out only once a mismatch is found.
+
+class _Batch(namedtuple("_Batch", "items text offset line line_start column")):
+    """Complete items of one chunk plus where `text` starts in the output."""
+
+
+def _line_batches(chunks):
+    carry = []  # pieces of a line cut by chunk edges, joined once the line ends
+    offset, line = 0, 1
+    for chunk in chunks:
+        if "\n" not in chunk:
+            carry.append(chunk)
+            continue
+        lines = chunk.split("\n")
+        if carry:
+            lines[0] = "".join(carry) + lines[0]
+        tail = lines.pop()
+        carry = [tail] if tail else []
+        text = "\n".join(lines) + "\n"
+        yield _Batch(lines, text, offset, line, offset, 1)
+        offset += len(text)
+        line += len(lines)
+    if carry:
+        last = "".join(carry)
+        yield _Batch([last], last, offset, line, offset, 1)
+
+
+def _without_leading_blanks(batches):
+    """Drop blank lines before the first text and left-strip that line (like `.trim()`)."""
+    for batch in batches:
+        items = batch.items
+        skip = 0
+        while skip < len(items) and not items[skip].strip():
+            skip += 1
+        if skip == len(items):
+            continue
+        first = items[skip].lstrip()
+        shift = len(items[skip]) - len(first)
+        offset = batch.offset + sum(len(item) + 1 for item in items[:skip]) + shift
+        yield _Batch([first] + items[skip + 1:], None, offset, batch.line + skip, offset - shift, shift + 1)
+        yield from batches
+        return
+
+
+def _token_batches(chunks):
+    carry = []  # pieces of a token cut by chunk edges, joined once the token ends
+    offset, line, line_start = 0, 1, 0
+    for chunk in chunks:
+        if chunk[-1].isspace():
+            keep = len(chunk)
+        else:  # hold back the token cut by the chunk edge; rsplit scans from the right in C
+            keep = len(chunk) - len(chunk.rsplit(None, 1)[-1])
+            if not keep:
+                carry.append(chunk)
+                continue
+        text = "".join(carry) + chunk[:keep] if carry else chunk[:keep]
+        carry = [chunk[keep:]] if keep < len(chunk) else []
+        yield _Batch(text.split(), text, offset, line, line_start, None)
+        newlines = text.count("\n")
+        if newlines:
+            line += newlines
+            line_start = offset + text.rfind("\n") + 1
+        offset += len(text)
+    if carry:
+        last = "".join(carry)
+        yield _Batch([last], last, offset, line, line_start, None)
+
+
+def _locate_line(batch, j, k=0):
+    """(line, column, offset) of character `k` of line `j` in `batch`."""
+    offset = batch.offset + sum(len(item) + 1 for item in batch.items[:j]) + k
+    column = (batch.column if j == 0 else 1) + k
+    return batch.line + j, column, offset
+
+
+def _locate_token(batch, j, k=0):
+    """(line, column, offset) of character `k` of token `j` in `batch`."""
+    m = next(itertools.islice(_TOKEN.finditer(batch.text), j, None))
+    start = m.start()
+    nl = batch.text.rfind("\n", 0, start)
+    line_start = batch.offset + nl + 1 if nl >= 0 else batch.line_start
+    line = batch.line + batch.text.count("\n", 0, start)
+    return line, batch.offset + start - line_start + 1 + k, batch.offset + start + k
+
+
+def _compare_items(expected, actual, same, locate, unit, blank=None):
+    """
+    Walk two streams of `_Batch`es in step until `same(expected_item,
+    actual_item)` fails. Items left over on one side are a mismatch unless
+    `blank(item)` says they can be ignored.
+    """
+    e, a = next(expected, None), next(actual, None)
+    last = None
+    ei = ai = index = 0
+    while True:
+        while e is not None and ei == len(e.items):
+            e, ei = next(expected, None), 0
+        while a is not None and ai == len(a.items):
+            a, ai = next(actual, None), 0
+        if e is None or a is None:
+            break
+        n = min(len(e.items) - ei, len(a.items) - ai)
+        xs, ys = e.items[ei:ei + n], a.items[ai:ai + n]
+        if xs != ys and not all(map(same, xs, ys)):
+            k = next(k for k in range(n) if not same(xs[k], ys[k]))
+            x, y = xs[k], ys[k]
+            if unit == "line":
+                x, y = x.rstrip(), y.rstrip()
+            c = _common_prefix(x, y) if unit == "line" else 0
+            line, column, offset = locate(a, ai + k, c)
+            what = f"line {line}" if unit == "line" else f"token {index + k + 1}"
+            return _mismatch(line, column, offset, x[c:c + SNIPPET], y[c:c + SNIPPET], f"{what} differs")
+        last = (a, ai + n - 1)
+        ei, ai, index = ei + n, ai + n, index + n
+
+    blank = blank or (lambda item: False)
+    while a is not None:
+        for j in range(ai, len(a.items)):
+            if not blank(a.items[j]):
+                line, column, offset = locate(a, j)
+                return _mismatch(line, column, offset, "", a.items[j][:SNIPPET], "extra output")
+        a, ai = next(actual, None), 0
+    while e is not None:
+        for item in e.items[ei:]:
+            if not blank(item):
+                if last is None:
+                    line, column, offset = 1, 1, 0
+                else:
+                    batch, j = last
+                    line, column, offset = locate(batch, j, len(batch.items[j]))
+                return _mismatch(line, column, offset, item[:SNIPPET], "", "output ends early")
+        e, ei = next(expected, None), 0
+    return None
+
+
+def _rstrip_equal(x, y):
+    return x.rstrip() == y.rstrip()
+
+
+def _is_blank(line):
+    return not line.strip()
+
+
+@register_rule("whitespace")
+def _whitespace(expected, actual):
+    return _compare_items(
+        _without_leading_blanks(_line_batches(expected)),
+        _without_leading_blanks(_line_batches(actual)),
+        _rstrip_equal, _locate_line, "line", _is_blank,
+    )
+
+
+@register_rule("token")
+def _token(expected, actual):
+    return _compare_items(
+        _token_batches(expected), _token_batches(actual), str.__eq__, _locate_token, "token"
+    )
+
+
+@register_rule("float")
+def _float(expected, actual, epsilon=1e-6):
+    def same(e, a):
+        if e == a:
+            return True
+        if "_" in e or "_" in a:  # float() would accept "1_000"
+            return False
+        try:
+            return math.isclose(float(e), float(a), rel_tol=epsilon, abs_tol=epsilon)
+        except ValueError:
+            return False
+
+    return _compare_items(_token_batches(expected), _token_batches(actual), same, _locate_token, "token")
+
+
+# ---- benchmark -----------------------------------------------------------
+
+def _materialized(rule, expected, actual, epsilon=1e-6):
+    """The read-everything-then-normalise approach the streaming rules replace."""
+    if rule == "exact":
+        return expected == actual
+    if rule == "whitespace":
+        def normalize(s):
+            return "\n".join(line.rstrip() for line in s.replace("\r\n", "\n").split("\n")).strip()
+        return normalize(expected) == normalize(actual)
+    e, a = expected.split(), actual.split()
+    if rule == "token":
+        return e == a
+    return len(e) == len(a) and all(
+        x == y or math.isclose(float(x), float(y), rel_tol=epsilon, abs_tol=epsilon)
+        for x, y in zip(e, a)
+    )
+
+
+def _write_synthetic(path, size_mb, variant):
+    """Write ~`size_mb` MB of "index value" lines; `variant` perturbs the copy under test."""
+    lines = int(size_mb * 1024 * 1024 / 22)
+    with open(path, "w", encoding="utf-8") as fh:
+        for start in range(0, lines, 10000):
+            rows = []
+            for i in range(start, min(start + 10000, lines)):
+                value = i * 0.5
+                if variant == "float_noise":
+                    value += 1e-8
+                elif variant == "late_mismatch" and i == lines - 1:
+                    value += 1
+                rows.append(f"{i} {value:.9f}\n")
+            fh.write("".join(rows))
+
+
+def _measure(fn):
+    """Run `fn` twice: once for wall time, once under tracemalloc for peak memory."""
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(seconds, 4), "peak_mb": round(peak / 2**20, 2), "match": result}
+
+
+def benchmark(size_mb=8, rules=None, epsilon=1e-6, chunk_size=CHUNK_SIZE):
+    """Time every rule, streaming vs materialised, on synthetic outputs of `size_mb` MB."""
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        expected = Path(tmp) / "expected.txt"
+        _write_synthetic(expected, size_mb, "identical")
+        for variant in ("identical", "late_mismatch", "float_noise"):
+            actual = Path(tmp) / f"{variant}.txt"
+            _write_synthetic(actual, size_mb, variant)
+            for rule in rules or sorted(RULES):
+                def streaming():
+                    with open(expected, encoding="utf-8") as e, open(actual, encoding="utf-8") as a:
+                        return compare(e, a, rule, chunk_size, **({"epsilon": epsilon} if rule == "float" else {})) is None
+
+                def materialized():
+                    return _materialized(rule, expected.read_text("utf-8"), actual.read_text("utf-8"), epsilon)
+
+                rows.append({
+                    "rule": rule,
+                    "variant": variant,
+                    "streaming": _measure(streaming),
+                    "materialized": _measure(materialized),
+                })
+    return {"size_mb": size_mb, "chunk_size": chunk_size, "epsilon": epsilon, "results": rows}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare program output against expected output.")
+    parser.add_argument("expected", nargs="?", help="expected output file")
+    parser.add_argument("actual", nargs="?", help="actual output file")
+    parser.add_argument("--rule", choices=sorted(RULES), default="whitespace")
+    parser.add_argument("--epsilon", type=float, default=1e-6, help="tolerance for --rule float")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--bench", action="store_true", help="benchmark all rules on synthetic outputs")
+    parser.add_argument("--size-mb", type=float, default=8, help="synthetic output size for --bench")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        print(json.dumps(benchmark(args.size_mb, epsilon=args.epsilon, chunk_size=args.chunk_size), indent=2))
+        return 0
+    if not (args.expected and args.actual):
+        parser.error("expected and actual files are required unless --bench is given")
+    options = {"epsilon": args.epsilon} if args.rule == "float" else {}
+    with open(args.expected, encoding="utf-8") as e, open(args.actual, encoding="utf-8") as a:
+        mismatch = compare(e, a, args.rule, args.chunk_size, **options)
+    print(json.dumps({"match": mismatch is None, "mismatch": mismatch}, indent=2))
+    return 0 if mismatch is None else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,337 @@
+# judge0_tools/grader.py
+"""
+Server-side batch grader with a verdict cache.
+
+The frontend's "Run all tests" sends one ``wait=true`` request per testcase.
+`Grader.grade` instead takes a submission plus a problem id from
+problems.json, looks every testcase up in a cache keyed by
+``(language_id, sha256(source), sha256(stdin))`` and sends only the misses to
+Judge0 as a single ``POST /submissions/batch``. Resubmitting identical code,
+or a popular reference solution, is answered straight from the cache.
+
+The cache stores what Judge0 *ran* (stdout, stderr, status, time, memory),
+never a pass/fail verdict, and `expected_output` is not sent to Judge0: the
+comparison against `expected` happens here with `compare.compare` (the
+frontend's whitespace rules unless the problem sets ``"checker"``), so a
+cached run stays valid for any problem that feeds it the same input.
+
+Run it as a small HTTP service with::
+
+    python -m judge0_tools.grader --port 2359
+
+and ``POST /grade`` a JSON body like
+``{"problem_id": 1, "language": "python", "source_code": "...", "stop_on_first_failure": true}``.
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from .client import DEFAULT_URL, MAX_BATCH_SIZE, PENDING_STATUS_IDS, Judge0Client, Judge0Error
+from .compare import compare
+from .problems import LANGUAGE_IDS, UnknownProblem, get_problem, load_problems
+
+# Outcomes that depend on load or on Judge0 itself rather than on the code:
+# Time Limit Exceeded, Internal Error, Exec Format Error
+UNCACHEABLE_STATUS_IDS = (5, 13, 14)
+
+CACHED_FIELDS = ("stdout", "stderr", "compile_output", "message", "status", "time", "memory")
+
+
+def cache_key(language_id, source_code, stdin):
+    """The cache key of one run: language plus hashes of the source and the input."""
+    return (
+        language_id,
+        hashlib.sha256(source_code.encode()).hexdigest(),
+        hashlib.sha256((stdin or "").encode()).hexdigest(),
+    )
+
+
+class VerdictCache:
+    """Thread-safe LRU of Judge0 runs keyed by `cache_key`."""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            run = self._entries.get(key)
+            if run is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return run
+
+    def put(self, key, run):
+        if (run.get("status") or {}).get("id") in UNCACHEABLE_STATUS_IDS:
+            return
+        with self._lock:
+            self._entries[key] = {k: run.get(k) for k in CACHED_FIELDS}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def judge_case(case, run, rule="whitespace", **options):
+    """
+    Turn one Judge0 run into the `{id, status, got, expected}` shape the
+    frontend's TestList renders, with status "pass", "fail" or "error".
+    A "fail" also carries the first `mismatch` found by `compare`.
+    """
+    stdout = (run.get("stdout") or "").strip()
+    stderr = (run.get("stderr") or "").strip()
+    compile_output = (run.get("compile_output") or "").strip()
+    status_id = (run.get("status") or {}).get("id")
+
+    got = stdout or stderr or compile_output
+    mismatch = None
+    if status_id != 3:
+        verdict = "error"
+        got = got or (run.get("status") or {}).get("description") or "Execution/Compile Error"
+    else:
+        mismatch = compare(case["expected"], run.get("stdout") or "", rule, **options)
+        verdict = "fail" if mismatch else "pass"
+        got = got or "(no visible output)"
+    result = {
+        "id": case["id"],
+        "status": verdict,
+        "got": got,
+        "expected": case["expected"],
+        "time": run.get("time"),
+        "memory": run.get("memory"),
+    }
+    if mismatch:
+        result["mismatch"] = mismatch
+    return result
+
+
+def problem_checker(problem):
+    """
+    How a problem wants outputs compared: ``{"rule": ..., **options}``.
+
+    Problems may set ``"checker"`` (a `compare.RULES` name) and, for the
+    ``float`` rule, ``"epsilon"``; the default is the frontend's whitespace rule.
+    """
+    checker = {"rule": problem.get("checker", "whitespace")}
+    if checker["rule"] == "float" and "epsilon" in problem:
+        checker["epsilon"] = problem["epsilon"]
+    return checker
+
+
+class Grader:
+    """
+    Grades submissions against problems.json through one Judge0 instance.
+
+    Share one `Grader` (and so one cache) between threads; each thread gets
+    its own Judge0 client.
+    """
+
+    def __init__(self, url=DEFAULT_URL, problems=None, cache=None,
+                 poll_interval=0.2, max_wait=60, batch_size=MAX_BATCH_SIZE, timeout=30):
+        self.url = url
+        self.problems = problems if problems is not None else load_problems()
+        self.cache = cache if cache is not None else VerdictCache()
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @property
+    def client(self):
+        if not hasattr(self._local, "client"):
+            self._local.client = Judge0Client(self.url, timeout=self.timeout)
+        return self._local.client
+
+    def grade(self, problem_id, language, source_code, stop_on_first_failure=False):
+        """
+        Grade `source_code` against every testcase of `problem_id`.
+
+        With `stop_on_first_failure`, grading returns as soon as any testcase
+        is known to fail (from the cache or from Judge0); testcases without a
+        result yet are reported as "skipped" and Judge0 is not polled further.
+        """
+        if language not in LANGUAGE_IDS:
+            raise ValueError(f"Unsupported language {language!r}")
+        problem = get_problem(problem_id, self.problems)
+        language_id = LANGUAGE_IDS[language]
+        cases = problem["testcases"]
+        checker = problem_checker(problem)
+
+        results = {}
+        pending = {}  # cache key -> testcases that share it
+        for case in cases:
+            key = cache_key(language_id, source_code, case["input"])
+            run = self.cache.get(key)
+            if run is not None:
+                results[case["id"]] = dict(judge_case(case, run, **checker), cached=True)
+            else:
+                pending.setdefault(key, []).append(case)
+
+        if pending and not (stop_on_first_failure and self._failed(results)):
+            self._run(language_id, source_code, pending, results, stop_on_first_failure, checker)
+
+        ordered = [
+            results.get(case["id"]) or {
+                "id": case["id"], "status": "skipped", "got": None, "expected": case["expected"],
+                "time": None, "memory": None, "cached": False,
+            }
+            for case in cases
+        ]
+        counts = {k: sum(1 for r in ordered if r["status"] == k) for k in ("pass", "fail", "error", "skipped")}
+        return {
+            "problem_id": problem["id"],
+            "language": language,
+            "passed": counts["pass"] == len(cases),
+            "summary": dict(counts, total=len(cases), cached=sum(1 for r in ordered if r["cached"])),
+            "results": ordered,
+        }
+
+    @staticmethod
+    def _failed(results):
+        return any(r["status"] != "pass" for r in results.values())
+
+    def _run(self, language_id, source_code, pending, results, stop_on_first_failure, checker):
+        """Send every pending key to Judge0 in batches and poll until done (or a failure)."""
+        keys = list(pending)
+        tokens = {}
+        for i in range(0, len(keys), self.batch_size):
+            chunk = keys[i:i + self.batch_size]
+            payloads = [
+                {"language_id": language_id, "source_code": source_code, "stdin": pending[k][0]["input"]}
+                for k in chunk
+            ]
+            tokens.update(zip(self.client.submit_batch(payloads), chunk))
+
+        deadline = time.monotonic() + self.max_wait
+        while tokens:
+            batch = list(tokens)
+            for token, run in zip(batch, self.client.get_batch(batch)):
+                if run is None or (run.get("status") or {}).get("id") in PENDING_STATUS_IDS:
+                    continue
+                key = tokens.pop(token)
+                self.cache.put(key, run)
+                for case in pending[key]:
+                    results[case["id"]] = dict(judge_case(case, run, **checker), cached=False)
+            if stop_on_first_failure and self._failed(results):
+                return
+            if tokens:
+                if time.monotonic() >= deadline:
+                    raise Judge0Error(f"{len(tokens)} testcases still pending after {self.max_wait}s")
+                time.sleep(self.poll_interval)
+
+
+def validate(body):
+    """Return 422 errors for a ``POST /grade`` body, or {} if it is fine."""
+    if not isinstance(body, dict):
+        return {"base": ["request body must be a JSON object"]}
+    errors = {}
+    for field, kind, name in (("problem_id", int, "an integer"), ("language", str, "a string"),
+                              ("source_code", str, "a string")):
+        value = body.get(field)
+        if value is None or value == "":
+            errors[field] = ["can't be blank"]
+        elif not isinstance(value, kind) or isinstance(value, bool):
+            errors[field] = [f"must be {name}"]
+    if not isinstance(body.get("stop_on_first_failure", False), bool):
+        errors["stop_on_first_failure"] = ["must be a boolean"]
+    return errors
+
+
+def _make_handler(grader):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code, body):
+            data = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/") == "/cache":
+                return self._send(200, grader.cache.stats())
+            self._send(404, {"error": "Not Found"})
+
+        def do_POST(self):
+            if self.path.rstrip("/") != "/grade":
+                return self._send(404, {"error": "Not Found"})
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"null")
+            except ValueError:
+                return self._send(400, {"error": "invalid JSON"})
+            errors = validate(body)
+            if errors:
+                return self._send(422, errors)
+            try:
+                result = grader.grade(
+                    body["problem_id"],
+                    body["language"],
+                    body["source_code"],
+                    body.get("stop_on_first_failure", False),
+                )
+            except UnknownProblem as e:
+                return self._send(404, {"error": e.args[0]})
+            except ValueError as e:
+                return self._send(422, {"error": str(e)})
+            except (requests.RequestException, Judge0Error) as e:
+                return self._send(502, {"error": f"Judge0 unavailable: {e}"})
+            except Exception as e:  # e.g. a malformed problem; answer rather than drop the connection
+                return self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            self._send(200, result)
+
+    return Handler
+
+
+def serve(grader, host="127.0.0.1", port=2359):
+    """Build (but do not start) the HTTP server for `grader`."""
+    server = ThreadingHTTPServer((host, port), _make_handler(grader))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch grader with a verdict cache in front of Judge0.")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Judge0 base URL (default: $JUDGE0_URL)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2359)
+    parser.add_argument("--problems", default=None, help="path to problems.json")
+    parser.add_argument("--cache-size", type=int, default=10000, help="max cached runs")
+    args = parser.parse_args(argv)
+
+    grader = Grader(args.url, load_problems(args.problems), VerdictCache(args.cache_size))
+    server = serve(grader, args.host, args.port)
+    print(f"Grader listening on http://{args.host}:{server.server_address[1]} (Judge0: {args.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# judge0_tools/loadtest.py
+"""
+Load generator and latency benchmark for a Judge0 deployment.
+
+Replays the templates and testcases from problems.json against Judge0 at a
+fixed concurrency and language mix, either with ``wait=true`` (what the
+frontend does) or by submitting with ``wait=false`` and polling the token.
+The report is JSON: throughput, p50/p95/p99 end-to-end latency, how that
+latency splits into queue time and execution time, verdict counts and error
+rates (overall and per language).
+
+Execution time is the `wall_time` Judge0 reports (requested with
+``fields=``), so programs that sleep or wait on I/O count as executing; it
+falls back to the CPU `time` when `wall_time` is missing. Queue time is
+end-to-end latency minus execution time, i.e. everything the submission
+spent not running: waiting for a worker, sandbox setup and the HTTP round
+trips.
+
+Examples::
+
+    # against the deployed instance
+    python -m judge0_tools.loadtest --concurrency 16 --submissions 400 --mix python=3,cpp=1
+
+    # against a local stand-in with 2 workers, token-polling mode
+    python -m judge0_tools.loadtest --standin --standin-workers 2 --mode poll
+
+    # the same, with Python run on warm workers (see warmpool.py)
+    python -m judge0_tools.loadtest --standin --standin-workers 2 --standin-warm-pool 4 --mode poll
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .client import DEFAULT_URL, Judge0Client, Judge0Error
+from .problems import LANGUAGE_IDS, load_problems
+from .standin import StandinJudge0
+from .stats import describe, percentile  # noqa: F401 (percentile is part of this module's API)
+from .warmpool import WarmPool
+
+MODES = ("wait", "poll")
+
+# Judge0 statuses that are the service failing rather than the submission
+ERROR_STATUS_IDS = (13, 14)
+
+# Judge0 leaves `wall_time` out unless asked for
+RESULT_FIELDS = ("token", "status", "time", "wall_time", "memory", "message")
+
+
+def parse_mix(spec):
+    """Parse ``"python=3,cpp=1"`` into ``{"python": 3.0, "cpp": 1.0}``."""
+    mix = {}
+    for part in spec.split(","):
+        lang, _, weight = part.strip().partition("=")
+        if lang not in LANGUAGE_IDS:
+            raise ValueError(f"Unknown language {lang!r}; expected one of {sorted(LANGUAGE_IDS)}")
+        mix[lang] = float(weight or 1)
+        if mix[lang] < 0:
+            raise ValueError(f"Negative weight for {lang!r}")
+    if not any(mix.values()):
+        raise ValueError("Language mix must have at least one positive weight")
+    return mix
+
+
+def build_jobs(problems, mix, count, seed=0):
+    """
+    Draw `count` submissions: a language from the weighted `mix`, then a
+    problem that has a template for it, then one of that problem's testcases.
+    """
+    rng = random.Random(seed)
+    languages = list(mix)
+    weights = [mix[lang] for lang in languages]
+    by_language = {
+        lang: [p for p in problems if p.get("templates", {}).get(lang) and p.get("testcases")]
+        for lang in languages
+    }
+    jobs = []
+    for _ in range(count):
+        lang = rng.choices(languages, weights)[0]
+        if not by_language[lang]:
+            raise ValueError(f"No problem has both a {lang} template and testcases")
+        problem = rng.choice(by_language[lang])
+        case = rng.choice(problem["testcases"])
+        jobs.append({
+            "language": lang,
+            "problem_id": problem["id"],
+            "testcase_id": case["id"],
+            "payload": {
+                "language_id": LANGUAGE_IDS[lang],
+                "source_code": problem["templates"][lang],
+                "stdin": case["input"],
+                "expected_output": case["expected"],
+            },
+        })
+    return jobs
+
+
+def _error_kind(exc):
+    if isinstance(exc, requests.Timeout):
+        return "timeout"
+    if isinstance(exc, requests.HTTPError):
+        return f"http_{exc.response.status_code}"
+    if isinstance(exc, requests.ConnectionError):
+        return "connection"
+    if isinstance(exc, Judge0Error):
+        return "poll_timeout"
+    return type(exc).__name__
+
+
+def run_job(client, job, mode="wait", poll_interval=0.25, max_wait=60):
+    """Send one submission and time it. Never raises; failures land in `error`."""
+    sample = {
+        "language": job["language"],
+        "problem_id": job["problem_id"],
+        "testcase_id": job["testcase_id"],
+        "status": None,
+        "error": None,
+        "polls": 0,
+    }
+    start = time.perf_counter()
+    try:
+        if mode == "wait":
+            result = client.submit_wait(job["payload"], RESULT_FIELDS)
+        else:
+            token = client.submit(job["payload"])
+            result, sample["polls"] = client.wait_for(token, poll_interval, max_wait, RESULT_FIELDS)
+    except (requests.RequestException, Judge0Error, ValueError) as e:
+        sample["e2e"] = time.perf_counter() - start
+        sample["error"] = _error_kind(e)
+        return sample
+    e2e = time.perf_counter() - start
+
+    status = result.get("status") or {}
+    exec_time = float(result.get("wall_time") or result.get("time") or 0)
+    sample.update(
+        status=status.get("description"),
+        e2e=e2e,
+        execution=exec_time,
+        queue=max(e2e - exec_time, 0.0),
+    )
+    if status.get("id") in ERROR_STATUS_IDS:
+        sample["error"] = "internal"
+    return sample
+
+
+def _latency(samples):
+    ok = [s for s in samples if s["error"] is None]
+    return {
+        "e2e": describe([s["e2e"] for s in ok]),
+        "queue": describe([s["queue"] for s in ok]),
+        "execution": describe([s["execution"] for s in ok]),
+    }
+
+
+def _errors(samples):
+    by_kind = {}
+    for s in samples:
+        if s["error"]:
+            by_kind[s["error"]] = by_kind.get(s["error"], 0) + 1
+    total = sum(by_kind.values())
+    return {
+        "total": total,
+        "rate": round(total / len(samples), 4) if samples else 0.0,
+        "by_kind": by_kind,
+    }
+
+
+def summarize(samples, duration, config=None):
+    """Aggregate per-submission samples into the machine-readable report."""
+    verdicts = {}
+    for s in samples:
+        if s["status"]:
+            verdicts[s["status"]] = verdicts.get(s["status"], 0) + 1
+
+    by_language = {}
+    for lang in sorted({s["language"] for s in samples}):
+        subset = [s for s in samples if s["language"] == lang]
+        by_language[lang] = {
+            "submissions": len(subset),
+            "latency_s": _latency(subset),
+            "errors": _errors(subset),
+        }
+
+    completed = sum(1 for s in samples if s["error"] is None)
+    return {
+        "config": config or {},
+        "duration_s": round(duration, 4),
+        "submissions": len(samples),
+        "completed": completed,
+        "throughput_per_s": round(completed / duration, 4) if duration > 0 else None,
+        "latency_s": _latency(samples),
+        "errors": _errors(samples),
+        "verdicts": verdicts,
+        "by_language": by_language,
+        "avg_polls": (
+            round(sum(s["polls"] for s in samples) / len(samples), 2) if samples else 0
+        ),
+    }
+
+
+def run_loadtest(url, jobs, concurrency=4, mode="wait", poll_interval=0.25, timeout=30, max_wait=60):
+    """Run `jobs` against Judge0 at `url` with `concurrency` clients; returns (samples, seconds)."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    local = threading.local()
+
+    def _client():
+        if not hasattr(local, "client"):
+            local.client = Judge0Client(url, timeout=timeout)
+        return local.client
+
+    def _run(job):
+        return run_job(_client(), job, mode, poll_interval, max_wait)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(_run, jobs))
+    return samples, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test Judge0 with the problems.json workload.")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Judge0 base URL (default: $JUDGE0_URL)")
+    parser.add_argument("--standin", action="store_true", help="run against a local stand-in instead of --url")
+    parser.add_argument("--standin-workers", type=int, default=2)
+    parser.add_argument("--standin-warm-pool", type=int, default=0, metavar="N",
+                        help="give the stand-in N warm Python workers (0: cold start)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--submissions", type=int, default=100)
+    parser.add_argument("--mode", choices=MODES, default="wait", help="wait=true or token polling")
+    parser.add_argument("--mix", default="python=1", help="language weights, e.g. python=3,cpp=1")
+    parser.add_argument("--problems", default=None, help="path to problems.json")
+    parser.add_argument("--difficulty", choices=("easy", "medium", "hard"), default=None)
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--timeout", type=float, default=30, help="per-request HTTP timeout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="write the JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    problems = load_problems(args.problems)
+    if args.difficulty:
+        problems = [p for p in problems if p.get("difficulty") == args.difficulty]
+    jobs = build_jobs(problems, mix, args.submissions, args.seed)
+
+    config = {
+        "url": "standin" if args.standin else args.url,
+        "mode": args.mode,
+        "concurrency": args.concurrency,
+        "mix": mix,
+        "difficulty": args.difficulty,
+        "seed": args.seed,
+    }
+    if args.standin:
+        config["standin_workers"] = args.standin_workers
+        config["standin_warm_pool"] = args.standin_warm_pool
+        pool = WarmPool(args.standin_warm_pool) if args.standin_warm_pool else None
+        try:
+            with StandinJudge0(workers=args.standin_workers, executor=pool.run if pool else None) as judge:
+                samples, duration = run_loadtest(
+                    judge.url, jobs, args.concurrency, args.mode, args.poll_interval, args.timeout
+                )
+        finally:
+            if pool:
+                pool.close()
+    else:
+        samples, duration = run_loadtest(
+            args.url, jobs, args.concurrency, args.mode, args.poll_interval, args.timeout
+        )
+
+    report = json.dumps(summarize(samples, duration, config), indent=2)
+    if args.output == "-":
+        print(report)
+    else:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
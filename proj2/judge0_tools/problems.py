@@ -0,0 +1,32 @@
+# judge0_tools/problems.py
+"""Access to the problem bank shared with the React frontend."""
+import json
+from pathlib import Path
+
+PROBLEMS_PATH = (
+    Path(__file__).resolve().parents[1] / "judge0-frontend" / "src" / "data" / "problems.json"
+)
+
+# Same ids the frontend sends (see `languageMap` in judge0-frontend/src/App.js)
+LANGUAGE_IDS = {"python": 71, "cpp": 54, "java": 62, "javascript": 63}
+
+# Every Python 3 id we have seen across Judge0 builds (tests/test_judge0.py tries the same list)
+PYTHON_IDS = (71, 92, 100, 102)
+
+
+class UnknownProblem(KeyError):
+    """No problem in the bank has the requested id."""
+
+
+def load_problems(path=None):
+    """Load the list of problems from problems.json (or `path` if given)."""
+    with open(path or PROBLEMS_PATH, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def get_problem(problem_id, problems=None):
+    """Return the problem with the given id, raising `UnknownProblem` if there is none."""
+    for problem in problems if problems is not None else load_problems():
+        if problem["id"] == problem_id:
+            return problem
+    raise UnknownProblem(f"Unknown problem id: {problem_id}")
@@ -0,0 +1,229 @@
+# judge0_tools/sandbox.py
+"""
+Cold-start Python execution that returns Judge0-shaped results.
+
+This is what a Judge0 worker does for a Python submission, minus the isolate
+sandbox: start a fresh interpreter, feed it stdin, enforce CPU/memory limits
+and report `stdout`, `stderr`, `status`, `time` and `memory`. The local
+stand-in server uses it so load tests behave like the real thing.
+"""
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Judge0 CE status ids (GET /statuses)
+STATUSES = {
+    1: "In Queue",
+    2: "Processing",
+    3: "Accepted",
+    4: "Wrong Answer",
+    5: "Time Limit Exceeded",
+    6: "Compilation Error",
+    7: "Runtime Error (SIGSEGV)",
+    8: "Runtime Error (SIGXFSZ)",
+    9: "Runtime Error (SIGFPE)",
+    10: "Runtime Error (SIGABRT)",
+    11: "Runtime Error (NZEC)",
+    12: "Runtime Error (Other)",
+    13: "Internal Error",
+    14: "Exec Format Error",
+}
+
+# Runtime errors Judge0 reports by the signal that killed the program
+SIGNAL_STATUSES = {signal.SIGSEGV: 7, signal.SIGXFSZ: 8, signal.SIGFPE: 9, signal.SIGABRT: 10}
+
+# Signals a process gets for running out of CPU time
+CPU_LIMIT_SIGNALS = (signal.SIGKILL, signal.SIGXCPU, signal.SIGPROF)
+
+# Judge0 CE defaults: 5s CPU, 128 MB
+DEFAULT_TIME_LIMIT = 5.0
+DEFAULT_MEMORY_LIMIT = 128000  # KB
+
+
+def status(status_id):
+    """Return the Judge0 `status` object for a status id."""
+    return {"id": status_id, "description": STATUSES[status_id]}
+
+
+def outputs_match(stdout, expected):
+    """Judge0's own check: outputs are equal once surrounding whitespace is dropped."""
+    return (stdout or "").strip() == (expected or "").strip()
+
+
+def verdict(returncode, stdout, expected_output=None, timed_out=False):
+    """Map a finished process onto a Judge0 status id."""
+    if timed_out:
+        return 5
+    if returncode < 0:
+        return SIGNAL_STATUSES.get(-returncode, 12)
+    if returncode != 0:
+        return 11
+    if expected_output is not None and not outputs_match(stdout, expected_output):
+        return 4
+    return 3
+
+
+# Runs inside the child interpreter, so nothing but exec() happens between
+# fork and exec in the (multi-threaded) parent. `set_limits` applies the
+# Judge0 CPU and memory limits to the child itself; `run_main` then runs the
+# submission the way ``python -c`` would: as a fresh ``__main__`` module with
+# ``sys.argv == ["-c"]``, waiting for non-daemon threads and running atexit
+# handlers before it returns the exit code.
+CHILD_RUNNER = r"""
+import math, os, resource, signal, sys, types
+
+
+def set_limits(time_limit, memory_limit):
+    # SIGPROF after time_limit s of CPU from now; RLIMIT_CPU backs it up in case it is caught
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    signal.setitimer(signal.ITIMER_PROF, time_limit)
+    cpu = math.ceil(usage.ru_utime + usage.ru_stime + time_limit) + 1
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    memory = memory_limit * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+
+
+def run_main(source_code):
+    main = types.ModuleType("__main__")
+    main.__loader__ = sys.modules["__main__"].__loader__
+    main.__builtins__ = __builtins__
+    main.__annotations__ = {}
+    sys.modules["__main__"] = main
+    sys.argv[:] = ["-c"]
+    code = 0
+    try:
+        exec(compile(source_code, "<string>", "exec"), main.__dict__)
+    except SystemExit as e:
+        code = exit_code(e)
+    except BaseException as e:
+        e.with_traceback(e.__traceback__.tb_next)  # hide this frame, like -c
+        sys.excepthook(type(e), e, e.__traceback__)
+        code = 1
+    try:
+        if "threading" in sys.modules:
+            sys.modules["threading"]._shutdown()
+        import atexit
+        atexit._run_exitfuncs()
+    except SystemExit as e:
+        code = exit_code(e)
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    return code & 0xFF
+
+
+def exit_code(e):
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+"""
+
+# argv: fd holding the source, time_limit, memory_limit. The source comes
+# through an inherited file because one argv string is capped at 128 KB.
+COLD_START = CHILD_RUNNER + r"""
+with open(int(sys.argv[1]), "rb") as source_file:
+    source = source_file.read().decode()
+set_limits(float(sys.argv[2]), int(sys.argv[3]))
+os._exit(run_main(source))
+"""
+
+
+def wait_with_timeout(proc, wall_limit):
+    """
+    Reap `proc`, killing it after `wall_limit` seconds of wall clock.
+
+    Returns ``(rusage, timed_out)``; the rusage comes from wait4() so it
+    describes this child only. Sets ``proc.returncode``.
+    """
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(wall_limit, _kill)
+    timer.start()
+    try:
+        _, wait_status, usage = os.wait4(proc.pid, 0)
+    finally:
+        timer.cancel()
+    proc.returncode = os.waitstatus_to_exitcode(wait_status)
+    return usage, timed_out.is_set()
+
+
+def judge0_result(returncode, stdout, stderr, cpu_time, memory, expected_output=None,
+                  time_limit=DEFAULT_TIME_LIMIT, timed_out=False, wall_time=None):
+    """Build the Judge0 submission fields for a finished Python process."""
+    # RLIMIT_CPU delivers SIGXCPU (or SIGKILL past the hard limit), a CPU itimer SIGPROF
+    over_cpu = -returncode in CPU_LIMIT_SIGNALS and cpu_time >= time_limit
+    status_id = verdict(returncode, stdout, expected_output, timed_out or over_cpu)
+    if status_id == 5:
+        message = "Time limit exceeded"
+    elif status_id == 11:
+        message = f"Exited with error status {returncode}"
+    elif status_id not in (3, 4):
+        message = f"Killed by signal {-returncode}"
+    else:
+        message = None
+    return {
+        "stdout": stdout or None,
+        "stderr": stderr or None,
+        "compile_output": None,
+        "message": message,
+        "exit_code": returncode,
+        "status": status(status_id),
+        "time": f"{cpu_time:.3f}",
+        "wall_time": f"{wall_time:.3f}" if wall_time is not None else None,
+        "memory": memory,
+    }
+
+
+def run_python(
+    source_code,
+    stdin="",
+    expected_output=None,
+    time_limit=DEFAULT_TIME_LIMIT,
+    memory_limit=DEFAULT_MEMORY_LIMIT,
+):
+    """
+    Run `source_code` in a brand new interpreter and return a Judge0-shaped dict.
+
+    `time` is the CPU time of the child and `wall_time` its wall-clock time
+    (like Judge0 reports them), `memory` its peak RSS in KB. The wall clock
+    is capped at twice the time limit to catch sleepers.
+    """
+    with tempfile.TemporaryFile() as fsrc, tempfile.TemporaryFile() as fin, \
+            tempfile.TemporaryFile() as fout, tempfile.TemporaryFile() as ferr:
+        fsrc.write(source_code.encode())
+        fsrc.seek(0)
+        fin.write((stdin or "").encode())
+        fin.seek(0)
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-I", "-c", COLD_START, str(fsrc.fileno()), str(time_limit), str(memory_limit)],
+            stdin=fin,
+            stdout=fout,
+            stderr=ferr,
+            pass_fds=(fsrc.fileno(),),
+        )
+        usage, timed_out = wait_with_timeout(proc, time_limit * 2)
+        wall_time = time.perf_counter() - start
+
+        fout.seek(0)
+        ferr.seek(0)
+        stdout = fout.read().decode(errors="replace")
+        stderr = ferr.read().decode(errors="replace")
+
+    return judge0_result(
+        proc.returncode, stdout, stderr, usage.ru_utime + usage.ru_stime, usage.ru_maxrss,
+        expected_output, time_limit, timed_out, wall_time,
+    )
@@ -0,0 +1,297 @@
+# judge0_tools/standin.py
+"""
+A local stand-in for the Judge0 submissions API.
+
+It speaks the subset of Judge0 CE the frontend and these tools use:
+
+- ``GET /`` and ``GET /languages``
+- ``POST /submissions?wait=true|false``
+- ``GET /submissions/{token}``
+- ``POST /submissions/batch`` and ``GET /submissions/batch?tokens=...``
+
+Submissions go through a FIFO queue served by a fixed number of worker
+threads, just like Judge0's workers, so queueing shows up under load. Python
+is really executed (see `sandbox.run_python`); the other languages are
+simulated with a fixed execution delay and empty output, which is enough to
+load-test a mixed workload without compilers installed.
+
+Run it standalone with::
+
+    python -m judge0_tools.standin --port 2358 --workers 4
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .client import MAX_BATCH_SIZE
+from .problems import LANGUAGE_IDS, PYTHON_IDS
+from .sandbox import run_python, status, verdict
+from .warmpool import WarmPool
+
+LANGUAGES = [
+    {"id": 54, "name": "C++ (GCC 9.2.0)"},
+    {"id": 62, "name": "Java (OpenJDK 13.0.1)"},
+    {"id": 63, "name": "JavaScript (Node.js 12.14.0)"},
+    {"id": 71, "name": "Python (3.8.1)"},
+]
+KNOWN_LANGUAGE_IDS = set(LANGUAGE_IDS.values()) | set(PYTHON_IDS)
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class StandinJudge0:
+    """
+    In-process Judge0 look-alike.
+
+    `workers` is the number of submissions executed at once; `simulated_time`
+    is how long a non-Python submission "runs". `executor` is called as
+    ``executor(source_code, stdin, expected_output)`` for Python submissions
+    and must return a Judge0-shaped dict.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, workers=2, simulated_time=0.05, executor=None):
+        self.workers = workers
+        self.simulated_time = simulated_time
+        self.executor = executor or run_python
+        self.submissions = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._threads = []
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        for _ in range(self.workers):
+            t = threading.Thread(target=self._work, daemon=True)
+            t.start()
+            self._threads.append(t)
+        t = threading.Thread(target=self._server.serve_forever, daemon=True)
+        t.start()
+        self._threads.append(t)
+        return self.url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        for _ in range(self.workers):
+            self._queue.put(None)
+        for t in self._threads:
+            t.join(timeout=5)
+        self._threads = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---- submissions ----------------------------------------------------
+
+    def enqueue(self, payload):
+        """Queue a validated payload and return its submission record."""
+        token = str(uuid.uuid4())
+        record = {
+            "token": token,
+            "payload": payload,
+            "result": {"status": status(1), "created_at": _now(), "finished_at": None},
+            "done": threading.Event(),
+        }
+        with self._lock:
+            self.submissions[token] = record
+        self._queue.put(record)
+        return record
+
+    def view(self, token, fields=None):
+        """
+        The submission as Judge0 returns it. `fields` (a list, like Judge0's
+        ``?fields=``) picks attributes; by default everything is returned.
+        """
+        with self._lock:
+            record = self.submissions.get(token)
+            if record is None:
+                return None
+            view = dict(record["result"], token=token)
+        if fields and "*" not in fields:
+            view = {f: view.get(f) for f in fields}
+        return view
+
+    def _work(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            with self._lock:
+                record["result"]["status"] = status(2)
+            start = time.perf_counter()
+            try:
+                result = self._execute(record["payload"])
+            except Exception as e:  # keep the worker alive, report like Judge0 does
+                result = {"status": status(13), "message": str(e)}
+            if result.get("wall_time") is None:  # executors that only report CPU time
+                result["wall_time"] = f"{time.perf_counter() - start:.3f}"
+            with self._lock:
+                record["result"].update(result, finished_at=_now())
+            record["done"].set()
+
+    def _execute(self, payload):
+        source = payload["source_code"]
+        stdin = payload.get("stdin") or ""
+        expected = payload.get("expected_output")
+        if payload["language_id"] in PYTHON_IDS:
+            return self.executor(source, stdin, expected)
+        time.sleep(self.simulated_time)
+        return {
+            "stdout": None,
+            "stderr": None,
+            "compile_output": None,
+            "message": None,
+            "exit_code": 0,
+            "status": status(verdict(0, "", expected)),
+            "time": f"{self.simulated_time:.3f}",
+            "wall_time": f"{self.simulated_time:.3f}",
+            "memory": 0,
+        }
+
+
+def validate(payload):
+    """Return Judge0-style 422 errors for a submission payload, or {} if it is fine."""
+    errors = {}
+    if not isinstance(payload, dict):
+        return {"base": ["request body must be a JSON object"]}
+    source = payload.get("source_code")
+    if not source:
+        errors["source_code"] = ["can't be blank"]
+    elif not isinstance(source, str):
+        errors["source_code"] = ["must be a string"]
+    lang = payload.get("language_id")
+    if lang is None:
+        errors["language_id"] = ["can't be blank"]
+    elif not isinstance(lang, int) or isinstance(lang, bool):
+        errors["language_id"] = ["must be an integer"]
+    elif lang not in KNOWN_LANGUAGE_IDS:
+        errors["language_id"] = [f"language with id {lang} doesn't exist"]
+    for field in ("stdin", "expected_output"):
+        if not isinstance(payload.get(field, ""), (str, type(None))):
+            errors[field] = ["must be a string"]
+    return errors
+
+
+def _make_handler(judge):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code, body):
+            data = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _route(self):
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            return parts, parse_qs(url.query)
+
+        @staticmethod
+        def _fields(query):
+            return [f for f in query.get("fields", [""])[0].split(",") if f] or None
+
+        def do_GET(self):
+            parts, query = self._route()
+            if not parts:
+                return self._send(200, {"name": "judge0-standin"})
+            if parts == ["languages"]:
+                return self._send(200, LANGUAGES)
+            if parts == ["submissions", "batch"]:
+                tokens = [t for t in query.get("tokens", [""])[0].split(",") if t]
+                fields = self._fields(query)
+                return self._send(200, {"submissions": [judge.view(t, fields) for t in tokens]})
+            if len(parts) == 2 and parts[0] == "submissions":
+                view = judge.view(parts[1], self._fields(query))
+                if view is None:
+                    return self._send(404, {"error": "Not Found"})
+                return self._send(200, view)
+            self._send(404, {"error": "Not Found"})
+
+        def do_POST(self):
+            parts, query = self._route()
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b"null")
+            except ValueError:
+                return self._send(400, {"error": "invalid JSON"})
+            if parts == ["submissions", "batch"]:
+                return self._post_batch(payload)
+            if parts != ["submissions"]:
+                return self._send(404, {"error": "Not Found"})
+            errors = validate(payload)
+            if errors:
+                return self._send(422, errors)
+            record = judge.enqueue(payload)
+            if query.get("wait", ["false"])[0] == "true":
+                record["done"].wait()
+                return self._send(201, judge.view(record["token"], self._fields(query)))
+            self._send(201, {"token": record["token"]})
+
+        def _post_batch(self, payload):
+            items = payload.get("submissions") if isinstance(payload, dict) else None
+            if not items:
+                return self._send(422, {"submissions": ["can't be blank"]})
+            if not isinstance(items, list):
+                return self._send(422, {"submissions": ["must be an array"]})
+            if len(items) > MAX_BATCH_SIZE:
+                return self._send(422, {"submissions": [f"size of batch should be <= {MAX_BATCH_SIZE}"]})
+            created = []
+            for item in items:
+                errors = validate(item)
+                created.append(errors or {"token": judge.enqueue(item)["token"]})
+            self._send(201, created)
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local Judge0 stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2358)
+    parser.add_argument("--workers", type=int, default=2, help="submissions executed at once")
+    parser.add_argument("--simulated-time", type=float, default=0.05,
+                        help="seconds a non-Python submission pretends to run")
+    parser.add_argument("--warm-pool", type=int, default=0, metavar="N",
+                        help="run Python on N pre-forked warm workers instead of a fresh interpreter")
+    args = parser.parse_args(argv)
+
+    pool = WarmPool(args.warm_pool) if args.warm_pool else None
+    judge = StandinJudge0(args.host, args.port, args.workers, args.simulated_time,
+                          executor=pool.run if pool else None)
+    print(f"Judge0 stand-in listening on {judge.start()}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        judge.stop()
+        if pool:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# judge0_tools/stats.py
+"""Latency statistics shared by the benchmarks."""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values` (0 < pct <= 100); None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil without floats
+    return ordered[int(rank) - 1]
+
+
+def describe(values):
+    """p50/p95/p99/mean/max of a list of seconds, rounded to 0.1 ms."""
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "mean": None, "max": None}
+    stats = {f"p{p}": percentile(values, p) for p in (50, 95, 99)}
+    stats["mean"] = sum(values) / len(values)
+    stats["max"] = max(values)
+    return {k: round(v, 4) for k, v in stats.items()}
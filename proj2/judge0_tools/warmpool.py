@@ -0,0 +1,369 @@
+# judge0_tools/warmpool.py
+"""
+Warm-worker pool for small Python submissions.
+
+Most submissions to the easy problems are a few lines of Python, so a cold
+run (`sandbox.run_python`) spends far longer starting an interpreter than
+running the program. `WarmPool` instead starts one "zygote" interpreter
+with the usual stdlib modules imported and has it fork `size` workers ahead
+of time. A submission is handed to an idle worker, which:
+
+1. points fds 0/1/2 at the submission's stdin/stdout/stderr files,
+2. applies the Judge0 CPU and memory limits,
+3. runs the source with `sandbox.CHILD_RUNNER`, exactly like the cold path
+   (a fresh ``__main__`` module, ``sys.argv == ["-c"]``, threads joined and
+   atexit handlers run), and exits with its exit code.
+
+Every worker runs exactly one submission and is then thrown away, so nothing
+leaks from one submission to the next; the zygote forks a replacement (about
+a millisecond, against tens of milliseconds for a fresh interpreter) as soon
+as a worker is taken. Workers still running at twice the time limit are
+killed, like in the cold path. Results have the same Judge0 shape (`stdout`,
+`stderr`, `status`, `time`, `memory`, ...) and verdicts as `run_python`.
+
+``python -m judge0_tools.warmpool --bench`` compares the two paths on the
+Python templates and testcases of problems.json.
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .problems import load_problems
+from .sandbox import (
+    CHILD_RUNNER,
+    DEFAULT_MEMORY_LIMIT,
+    DEFAULT_TIME_LIMIT,
+    judge0_result,
+    run_python,
+)
+from .stats import describe
+
+# The zygote: a warm interpreter that forks single-use workers. Its stdin
+# carries one JSON job per line from `WarmPool`; its stdout carries one JSON
+# result per line back. It stays single-threaded because it forks. Workers
+# run submissions with the same `CHILD_RUNNER` as the cold path.
+ZYGOTE = CHILD_RUNNER + r"""
+import json, selectors, time
+import bisect, collections, functools, heapq, itertools, math, re, string  # warm the usual imports
+
+SIZE = int(sys.argv[1])
+ready = collections.deque()  # (pid, fd the job is written to)
+running = {}  # pid -> [job id, wall-clock deadline, killed, start]
+wake_r, wake_w = os.pipe()
+os.set_blocking(wake_r, False)
+os.set_blocking(wake_w, False)
+
+
+def run_job(job_fd, inherited):
+    # In the forked worker: wait for a job, become the submission, exit.
+    for fd in inherited:
+        os.close(fd)
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    chunks = []
+    while True:
+        chunk = os.read(job_fd, 65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    if not chunks:  # zygote is shutting down
+        os._exit(0)
+    os.close(job_fd)
+    job = json.loads(b"".join(chunks))
+
+    for fd, path, flags in ((0, job["stdin"], os.O_RDONLY), (1, job["stdout"], os.O_WRONLY),
+                            (2, job["stderr"], os.O_WRONLY)):
+        new = os.open(path, flags)
+        os.dup2(new, fd)
+        os.close(new)
+    set_limits(job["time_limit"], job["memory_limit"])
+    os._exit(run_main(job["source"]))
+
+
+def prefork():
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(w)
+            run_job(r, [fd for _, fd in ready] + [wake_r, wake_w, selector.fileno()])
+        finally:
+            os._exit(70)
+    os.close(r)
+    ready.append((pid, w))
+
+
+def dispatch(job):
+    data = json.dumps(job).encode()
+    while True:
+        if not ready:
+            prefork()
+        pid, w = ready.popleft()
+        try:
+            while data:
+                data = data[os.write(w, data):]
+        except BrokenPipeError:  # that worker died while idle; use another
+            os.close(w)
+            data = json.dumps(job).encode()
+            continue
+        os.close(w)
+        now = time.monotonic()
+        running[pid] = [job["id"], now + job["wall_limit"], False, now]
+        prefork()
+        return
+
+
+def reap():
+    while True:
+        try:
+            pid, status, usage = os.wait4(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        entry = running.pop(pid, None)
+        if entry is None:
+            continue
+        result = {
+            "id": entry[0],
+            "returncode": os.waitstatus_to_exitcode(status),
+            "cpu": usage.ru_utime + usage.ru_stime,
+            "memory": usage.ru_maxrss,
+            "timed_out": entry[2],
+            "wall": time.monotonic() - entry[3],
+        }
+        os.write(1, json.dumps(result).encode() + b"\n")
+
+
+signal.set_wakeup_fd(wake_w)
+signal.signal(signal.SIGCHLD, lambda *args: None)
+selector = selectors.DefaultSelector()
+selector.register(0, selectors.EVENT_READ)
+selector.register(wake_r, selectors.EVENT_READ)
+for _ in range(SIZE):
+    prefork()
+
+pending = b""
+while True:
+    timeout = None
+    if running:
+        timeout = max(0.0, min(entry[1] for entry in running.values()) - time.monotonic())
+    for key, _ in selector.select(timeout):
+        if key.fd == wake_r:
+            try:
+                os.read(wake_r, 4096)
+            except BlockingIOError:
+                pass
+            continue
+        data = os.read(0, 65536)
+        if not data:  # WarmPool closed: idle workers see EOF, running ones are killed
+            for _, w in ready:
+                os.close(w)
+            for pid in running:
+                os.kill(pid, signal.SIGKILL)
+            sys.exit(0)
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            dispatch(json.loads(line))
+    reap()
+    now = time.monotonic()
+    for pid, entry in running.items():
+        if entry[1] <= now and not entry[2]:
+            os.kill(pid, signal.SIGKILL)
+            entry[2] = True
+"""
+
+
+class WarmPool:
+    """
+    A zygote process that keeps `size` forked Python workers ready to run
+    one submission each. At most `size` submissions run at once; further
+    `run` calls wait for one to finish.
+
+    Use as a context manager, or call `close()` when done. `run` has the same
+    signature and result shape as `sandbox.run_python` and is thread-safe, so
+    a pool can be plugged into `StandinJudge0(executor=pool.run)`.
+    """
+
+    def __init__(self, size=4, time_limit=DEFAULT_TIME_LIMIT, memory_limit=DEFAULT_MEMORY_LIMIT):
+        self.size = size
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self._tmp = tempfile.TemporaryDirectory(prefix="warmpool-")
+        self._ids = itertools.count()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+        self._zygote = subprocess.Popen(
+            [sys.executable, "-I", "-c", ZYGOTE, str(size)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._reader = threading.Thread(target=self._read_results, daemon=True)
+        self._reader.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut the zygote down; idle workers exit and running ones are killed."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._zygote.stdin.close()
+        self._zygote.wait(timeout=10)
+        self._reader.join(timeout=10)
+        self._zygote.stdout.close()
+        self._tmp.cleanup()
+
+    def _read_results(self):
+        for line in self._zygote.stdout:
+            result = json.loads(line)
+            with self._lock:
+                slot = self._pending.pop(result["id"], None)
+            if slot is not None:
+                slot[1] = result
+                slot[0].set()
+        with self._lock:  # zygote is gone: nobody will answer the rest
+            for slot in self._pending.values():
+                slot[0].set()
+            self._pending.clear()
+
+    def run(self, source_code, stdin="", expected_output=None, time_limit=None, memory_limit=None):
+        """Run `source_code` on a warm worker and return a Judge0-shaped dict."""
+        time_limit = time_limit or self.time_limit
+        memory_limit = memory_limit or self.memory_limit
+        with self._slots:  # at most `size` submissions run at once
+            if self._closed:
+                raise RuntimeError("WarmPool is closed")
+
+            paths = {}
+            for name in ("stdin", "stdout", "stderr"):
+                fd, paths[name] = tempfile.mkstemp(prefix=f"{name}-", dir=self._tmp.name)
+                with os.fdopen(fd, "wb") as fh:
+                    if name == "stdin":
+                        fh.write((stdin or "").encode())
+            try:
+                slot = [threading.Event(), None]
+                job = dict(
+                    paths,
+                    id=next(self._ids),
+                    source=source_code,
+                    time_limit=time_limit,
+                    memory_limit=memory_limit,
+                    wall_limit=time_limit * 2,
+                )
+                with self._lock:
+                    if self._closed or self._zygote.poll() is not None:
+                        raise RuntimeError("WarmPool is closed")
+                    self._pending[job["id"]] = slot
+                    self._zygote.stdin.write(json.dumps(job).encode() + b"\n")
+                    self._zygote.stdin.flush()
+                slot[0].wait()
+                result = slot[1]
+                if result is None:
+                    raise RuntimeError("WarmPool zygote exited")
+                with open(paths["stdout"], "rb") as fh:
+                    stdout = fh.read().decode(errors="replace")
+                with open(paths["stderr"], "rb") as fh:
+                    stderr = fh.read().decode(errors="replace")
+            finally:
+                for path in paths.values():
+                    os.unlink(path)
+
+        return judge0_result(
+            result["returncode"], stdout, stderr, result["cpu"], result["memory"],
+            expected_output, time_limit, result["timed_out"], result["wall"],
+        )
+
+
+def _python_workload(problems, difficulty="easy"):
+    """(source, stdin, expected) for every Python template + testcase of `difficulty`."""
+    return [
+        (p["templates"]["python"], case["input"], case["expected"])
+        for p in problems
+        if p.get("difficulty") == difficulty and p.get("templates", {}).get("python")
+        for case in p["testcases"]
+    ]
+
+
+def benchmark(runs=50, size=4, concurrency=1, difficulty="easy", problems=None):
+    """
+    Run the same Python workload `runs` times through the cold path and the
+    warm pool and return latency stats (seconds) for both.
+    """
+    workload = _python_workload(problems if problems is not None else load_problems(), difficulty)
+    if not workload:
+        raise ValueError(f"No {difficulty} problem has a Python template")
+    jobs = [workload[i % len(workload)] for i in range(runs)]
+
+    def _time(execute):
+        def _one(job):
+            start = time.perf_counter()
+            result = execute(*job)
+            return time.perf_counter() - start, float(result["time"]), result["status"]["id"]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(_one, jobs))
+        wall = time.perf_counter() - start
+        return {
+            "latency_s": describe([s[0] for s in samples]),
+            "execution_s": describe([s[1] for s in samples]),
+            "throughput_per_s": round(len(samples) / wall, 2),
+            "statuses": sorted({s[2] for s in samples}),
+        }
+
+    cold = _time(run_python)
+    with WarmPool(size) as pool:
+        time.sleep(0.5)  # let the zygote start and fork its first workers
+        warm = _time(pool.run)
+    speedup = cold["latency_s"]["p50"] / warm["latency_s"]["p50"] if warm["latency_s"]["p50"] else None
+    return {
+        "runs": runs,
+        "pool_size": size,
+        "concurrency": concurrency,
+        "difficulty": difficulty,
+        "cold": cold,
+        "warm": warm,
+        "p50_speedup": round(speedup, 2) if speedup else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm Python worker pool (Judge0-shaped results).")
+    parser.add_argument("--bench", action="store_true", help="compare warm-pool and cold-start latency")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--size", type=int, default=4, help="number of warm workers")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--difficulty", choices=("easy", "medium", "hard"), default="easy")
+    parser.add_argument("--source", help="run this Python file once on a warm worker instead")
+    parser.add_argument("--stdin", default="", help="stdin for --source")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        report = benchmark(args.runs, args.size, args.concurrency, args.difficulty)
+    elif args.source:
+        with open(args.source, encoding="utf-8") as fh, WarmPool(1) as pool:
+            report = pool.run(fh.read(), args.stdin)
+    else:
+        parser.error("pass --bench or --source")
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
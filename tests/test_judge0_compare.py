@@ -0,0 +1,105 @@
+# tests/test_judge0_compare.py
+import io
+import time
+
+import pytest
+
+from judge0_tools.compare import RULES, benchmark, compare, register_rule
+
+
+def _chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _location(mismatch):
+    return mismatch and (mismatch["line"], mismatch["column"], mismatch["offset"], mismatch["reason"])
+
+
+@pytest.mark.parametrize(
+    "rule, expected, actual, where",
+    [
+        ("exact", "ab\ncd\n", "ab\ncd\n", None),
+        ("exact", "ab\ncd\n", "ab\ncx\n", (2, 2, 4, "outputs differ")),
+        ("exact", "ab\n", "ab\nzz", (2, 1, 3, "extra output")),
+        ("exact", "3\n", "3", (1, 2, 1, "output ends early")),
+        ("whitespace", "  3 \n\n", "3", None),
+        ("whitespace", "1\r\n2\r\n", "1\n2", None),
+        ("whitespace", "a\nb", "a\nb\n\n  \n", None),
+        ("whitespace", "a\n\nb\n", "a\nb", (2, 1, 2, "line 2 differs")),
+        ("whitespace", "hello world", "\n  hello wurld", (2, 10, 10, "line 2 differs")),
+        ("token", "1 2\n3", "1\n2   3\n", None),
+        ("token", "aa bb\ncc dd", "aa bb\n\ncc de", (3, 4, 10, "token 4 differs")),
+        ("token", "1 2", "1 2 3", (1, 5, 4, "extra output")),
+        ("token", "1 2 3", "1 2", (1, 4, 3, "output ends early")),
+        ("float", "0.333333 2", "0.3333333 2.0000001", None),
+        ("float", "1.0 2.5", "1.0 2.6", (1, 5, 4, "token 2 differs")),
+        ("float", "10", "1_0", (1, 1, 0, "token 1 differs")),
+        ("float", "YES", "NO", (1, 1, 0, "token 1 differs")),
+    ],
+)
+def test_rules_report_first_mismatch(rule, expected, actual, where):
+    whole = compare(expected, actual, rule)
+    assert _location(whole) == where
+    # the answer, snippets included, must not depend on where chunks happen to be cut
+    for size in (1, 2, 3, 7):
+        assert compare(_chunked(expected, size), _chunked(actual, size), rule) == whole
+
+
+def test_mismatch_carries_rule_and_snippets():
+    mismatch = compare("1 2 3\n", "1 2 4\n", "token")
+    assert mismatch["rule"] == "token"
+    assert (mismatch["expected"], mismatch["got"]) == ("3", "4")
+    # exact snippets read ahead across chunk edges
+    expected, actual = "ab\ncd" + "e" * 40, "ab\ncx" + "e" * 40
+    for size in (1, 4, 64):
+        mismatch = compare(expected, actual, "exact", chunk_size=size)
+        assert (mismatch["expected"], mismatch["got"]) == ("d" + "e" * 31, "x" + "e" * 31)
+
+
+def test_float_epsilon_is_configurable():
+    assert compare("1.0", "1.01", "float", epsilon=0.1) is None
+    assert compare("1.0", "1.01", "float", epsilon=1e-3) is not None
+
+
+def test_reads_file_objects_in_chunks():
+    expected = "".join(f"{i}\n" for i in range(20000))
+    actual = expected.replace("19999\n", "19998\n")
+    mismatch = compare(io.StringIO(expected), io.StringIO(actual), "whitespace", chunk_size=4096)
+    assert (mismatch["line"], mismatch["column"]) == (20000, 5)
+    assert compare(io.StringIO(expected), io.StringIO(expected), "exact", chunk_size=4096) is None
+
+
+@pytest.mark.parametrize("rule", ["whitespace", "token", "float"])
+def test_long_single_token_is_linear(rule):
+    """A multi-megabyte token or line is carried across chunks without rescanning it."""
+    big = "9" * (4 * 1024 * 1024)
+    start = time.perf_counter()
+    assert compare(big, big, rule, chunk_size=4096) is None
+    assert time.perf_counter() - start < 2
+    mismatch = compare(big + " 1\n", big + " 2\n", rule, chunk_size=4096)
+    assert (mismatch["line"], mismatch["offset"]) == (1, len(big) + 1)
+
+
+def test_register_custom_rule():
+    @register_rule("case_insensitive")
+    def _case_insensitive(expected, actual):
+        return RULES["exact"]((c.lower() for c in expected), (c.lower() for c in actual))
+
+    try:
+        assert compare("YES\n", "yes\n", "case_insensitive") is None
+    finally:
+        del RULES["case_insensitive"]
+    with pytest.raises(ValueError):
+        compare("a", "a", "case_insensitive")
+
+
+def test_benchmark_reports_every_rule():
+    report = benchmark(size_mb=0.05)
+    rows = {(r["rule"], r["variant"]): r for r in report["results"]}
+    assert {rule for rule, _ in rows} == set(RULES)
+    for rule in RULES:
+        assert rows[(rule, "identical")]["streaming"]["match"] is True
+        assert rows[(rule, "late_mismatch")]["streaming"]["match"] is False
+    assert rows[("float", "float_noise")]["streaming"]["match"] is True
+    for row in report["results"]:
+        assert row["streaming"]["match"] == row["materialized"]["match"]
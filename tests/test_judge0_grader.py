@@ -0,0 +1,177 @@
+# tests/test_judge0_grader.py
+import json
+import threading
+
+import pytest
+import requests
+
+from judge0_tools.client import Judge0Client, Judge0Error
+from judge0_tools.grader import Grader, VerdictCache, cache_key, judge_case, serve
+from judge0_tools.problems import UnknownProblem
+from judge0_tools.standin import StandinJudge0
+
+SUM_OK = "a, b = map(int, input().split())\nprint(a + b)\n"
+# right for T1 (1 2 -> 3) only
+SUM_WRONG = "a, b = map(int, input().split())\nprint(3)\n"
+
+
+@pytest.fixture()
+def standin():
+    with StandinJudge0(workers=2) as judge:
+        yield judge
+
+
+@pytest.fixture()
+def grader(standin):
+    return Grader(standin.url, poll_interval=0.02)
+
+
+def test_cache_key_separates_language_source_and_input():
+    base = cache_key(71, SUM_OK, "1 2\n")
+    assert base == cache_key(71, SUM_OK, "1 2\n")
+    assert base != cache_key(92, SUM_OK, "1 2\n")
+    assert base != cache_key(71, SUM_WRONG, "1 2\n")
+    assert base != cache_key(71, SUM_OK, "1 3\n")
+
+
+def test_verdict_cache_is_lru_and_skips_unstable_statuses():
+    cache = VerdictCache(max_entries=2)
+    cache.put("a", {"status": {"id": 3}, "stdout": "1"})
+    cache.put("b", {"status": {"id": 3}, "stdout": "2"})
+    cache.get("a")
+    cache.put("c", {"status": {"id": 3}, "stdout": "3"})
+    assert cache.get("b") is None  # least recently used went first
+    assert cache.get("a")["stdout"] == "1"
+    cache.put("tle", {"status": {"id": 5}})
+    assert cache.get("tle") is None
+
+
+def test_judge_case_matches_frontend_statuses():
+    case = {"id": "T1", "expected": "3\n"}
+    assert judge_case(case, {"status": {"id": 3}, "stdout": "3  \r\n"})["status"] == "pass"
+    assert judge_case(case, {"status": {"id": 3}, "stdout": "4\n"})["status"] == "fail"
+    err = judge_case(case, {"status": {"id": 11}, "stderr": "ZeroDivisionError"})
+    assert err["status"] == "error" and err["got"] == "ZeroDivisionError"
+
+
+def test_grade_runs_all_cases_in_one_batch_then_hits_cache(grader, standin):
+    first = grader.grade(1, "python", SUM_OK)
+    assert first["passed"] is True
+    assert first["summary"] == {"pass": 5, "fail": 0, "error": 0, "skipped": 0, "total": 5, "cached": 0}
+    assert len(standin.submissions) == 5
+
+    again = grader.grade(1, "python", SUM_OK)
+    assert again["passed"] is True
+    assert again["summary"]["cached"] == 5
+    assert len(standin.submissions) == 5  # Judge0 was not touched
+    assert grader.cache.stats()["hits"] == 5
+
+
+def test_grade_reports_failures_in_testcase_order(grader):
+    result = grader.grade(1, "python", SUM_WRONG)
+    assert result["passed"] is False
+    assert [r["status"] for r in result["results"]] == ["pass", "fail", "fail", "fail", "fail"]
+    assert [r["id"] for r in result["results"]] == ["T1", "T2", "H1", "H2", "H3"]
+
+
+def test_stop_on_first_failure_uses_cached_failure_without_judge0(grader, standin):
+    grader.grade(1, "python", SUM_WRONG)
+    sent = len(standin.submissions)
+    grader.cache = VerdictCache()
+    grader.cache.put(cache_key(71, SUM_WRONG, "100 -40\n"), {"status": {"id": 3}, "stdout": "3\n"})
+
+    result = grader.grade(1, "python", SUM_WRONG, stop_on_first_failure=True)
+    assert result["passed"] is False
+    assert len(standin.submissions) == sent
+    assert result["summary"]["fail"] == 1 and result["summary"]["skipped"] == 4
+
+
+def test_grade_rejects_unknown_problem_and_language(grader):
+    with pytest.raises(UnknownProblem):
+        grader.grade(9999, "python", SUM_OK)
+    with pytest.raises(ValueError):
+        grader.grade(1, "cobol", SUM_OK)
+
+
+def test_grade_over_http(grader):
+    server = serve(grader, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        r = requests.post(f"{base}/grade", json={"problem_id": 1, "language": "python", "source_code": SUM_OK})
+        assert r.status_code == 200 and r.json()["passed"] is True
+        r = requests.post(f"{base}/grade", json={"problem_id": 9999, "language": "python", "source_code": SUM_OK})
+        assert r.status_code == 404
+        r = requests.post(f"{base}/grade", data=json.dumps({"language": "python"}))
+        assert r.status_code == 422 and set(r.json()) == {"problem_id", "source_code"}
+        r = requests.post(f"{base}/grade", json={"problem_id": 0, "language": "python", "source_code": SUM_OK})
+        assert r.status_code == 404  # 0 is an id, not a blank field
+        bad_bodies = [
+            ([1], {"base"}),
+            ({"problem_id": 1, "language": "python", "source_code": 42}, {"source_code"}),
+            ({"problem_id": 1, "language": ["python"], "source_code": SUM_OK}, {"language"}),
+            ({"problem_id": "1", "language": "python", "source_code": SUM_OK}, {"problem_id"}),
+            ({"problem_id": 1, "language": "python", "source_code": SUM_OK, "stop_on_first_failure": "yes"},
+             {"stop_on_first_failure"}),
+        ]
+        for body, fields in bad_bodies:
+            r = requests.post(f"{base}/grade", json=body)
+            assert r.status_code == 422 and set(r.json()) == fields
+        assert requests.get(f"{base}/cache").json()["entries"] == 5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_only_unknown_problems_are_404(standin):
+    """A broken problem or Judge0 reply is a server error, not "not found"."""
+    problems = [{"id": 1}, {"id": 2, "testcases": [{"id": "T1", "input": "1 2\n"}]}]
+    server = serve(Grader(standin.url, problems=problems, poll_interval=0.02), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        for problem_id in (1, 2):
+            r = requests.post(f"{base}/grade", json={"problem_id": problem_id, "language": "python",
+                                                     "source_code": SUM_OK})
+            assert r.status_code == 500 and "KeyError" in r.json()["error"]
+        r = requests.post(f"{base}/grade", json={"problem_id": 3, "language": "python", "source_code": SUM_OK})
+        assert r.status_code == 404 and r.json()["error"] == "Unknown problem id: 3"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _BusyReply:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"error": "busy"}
+
+
+class _BusySession:
+    def get(self, *args, **kwargs):
+        return _BusyReply()
+
+
+def test_get_batch_rejects_unexpected_replies():
+    """A batch reply without "submissions" is a Judge0 error (502), not a KeyError."""
+    with pytest.raises(Judge0Error):
+        Judge0Client("http://judge0.invalid", session=_BusySession()).get_batch(["t"])
+
+
+def test_grade_uses_problem_checker(standin):
+    problems = [{
+        "id": 100,
+        "checker": "float",
+        "epsilon": 1e-3,
+        "testcases": [{"id": "T1", "input": "1 3\n", "expected": "0.333\n"}],
+    }]
+    grader = Grader(standin.url, problems=problems, poll_interval=0.02)
+    divide = "a, b = map(int, input().split())\nprint(a / b)\n"
+    assert grader.grade(100, "python", divide)["passed"] is True
+
+    problems[0]["checker"] = "whitespace"
+    failed = grader.grade(100, "python", divide)["results"][0]
+    assert failed["status"] == "fail"
+    assert failed["mismatch"]["line"] == 1
@@ -0,0 +1,153 @@
+# tests/test_judge0_loadtest.py
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from judge0_tools.client import Judge0Client
+from judge0_tools.loadtest import build_jobs, main, parse_mix, percentile, run_job, run_loadtest, summarize
+from judge0_tools.problems import LANGUAGE_IDS, load_problems
+from judge0_tools.sandbox import run_python
+from judge0_tools.standin import StandinJudge0
+
+
+@pytest.fixture(scope="module")
+def standin():
+    with StandinJudge0(workers=2, simulated_time=0.01) as judge:
+        yield judge
+
+
+def test_parse_mix():
+    assert parse_mix("python=3,cpp=1") == {"python": 3.0, "cpp": 1.0}
+    assert parse_mix("java") == {"java": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("cobol=1")
+    with pytest.raises(ValueError):
+        parse_mix("python=0")
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) is None
+
+
+def test_build_jobs_replays_problem_templates():
+    """Every job is a real template + testcase from problems.json, honouring the mix."""
+    problems = load_problems()
+    jobs = build_jobs(problems, {"python": 1, "java": 0}, 50, seed=1)
+    assert len(jobs) == 50
+    by_id = {p["id"]: p for p in problems}
+    for job in jobs:
+        assert job["language"] == "python"
+        problem = by_id[job["problem_id"]]
+        case = next(c for c in problem["testcases"] if c["id"] == job["testcase_id"])
+        assert job["payload"] == {
+            "language_id": LANGUAGE_IDS["python"],
+            "source_code": problem["templates"]["python"],
+            "stdin": case["input"],
+            "expected_output": case["expected"],
+        }
+    # same seed, same workload
+    assert build_jobs(problems, {"python": 1}, 10, seed=3) == build_jobs(problems, {"python": 1}, 10, seed=3)
+
+
+def test_run_python_limits_apply_in_the_child():
+    """Limits are set by the child interpreter, so many threads can start runs at once."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: run_python(f"print({i} * 2)"), range(16)))
+    assert [r["stdout"] for r in results] == [f"{i * 2}\n" for i in range(16)]
+    assert run_python("while True: pass", time_limit=0.5)["status"]["id"] == 5
+    memory = run_python("x = bytearray(256 * 1024 * 1024)")
+    assert memory["status"]["id"] == 11 and memory["stderr"].endswith("MemoryError\n")
+    big = "x = 0\n" + "x += 1\n" * 40000 + "print(x)"  # one argv string is capped at 128 KB
+    assert len(big) > 128 * 1024
+    assert run_python(big)["stdout"] == "40000\n"
+    result = run_python("import sys\nprint(__name__, sys.argv)\nraise ValueError('boom')")
+    assert result["stdout"] == "__main__ ['-c']\n"
+    assert result["stderr"] == (
+        'Traceback (most recent call last):\n  File "<string>", line 3, in <module>\nValueError: boom\n'
+    )
+
+
+@pytest.mark.parametrize("mode", ["wait", "poll"])
+def test_loadtest_against_standin(standin, mode):
+    jobs = build_jobs(load_problems(), {"python": 1, "cpp": 1}, 12, seed=0)
+    samples, duration = run_loadtest(standin.url, jobs, concurrency=4, mode=mode, poll_interval=0.02)
+    report = summarize(samples, duration)
+
+    assert report["submissions"] == report["completed"] == 12
+    assert report["errors"] == {"total": 0, "rate": 0.0, "by_kind": {}}
+    assert report["throughput_per_s"] > 0
+    assert sum(report["verdicts"].values()) == 12
+    assert set(report["by_language"]) == {"python", "cpp"}
+    e2e = report["latency_s"]["e2e"]
+    assert e2e["p50"] <= e2e["p95"] <= e2e["p99"] <= e2e["max"]
+    for s in samples:
+        assert s["queue"] + s["execution"] == pytest.approx(s["e2e"], abs=1e-3)
+    if mode == "poll":
+        assert report["avg_polls"] >= 1
+
+
+def test_loadtest_counts_errors(standin):
+    """Rejected submissions (here: unknown language) show up as errors, not verdicts."""
+    job = {
+        "language": "python",
+        "problem_id": 1,
+        "testcase_id": "T1",
+        "payload": {"language_id": 999999, "source_code": "print(1)", "stdin": ""},
+    }
+    samples, duration = run_loadtest(standin.url, [job] * 3, concurrency=2)
+    report = summarize(samples, duration)
+    assert report["completed"] == 0
+    assert report["errors"] == {"total": 3, "rate": 1.0, "by_kind": {"http_422": 3}}
+
+
+@pytest.mark.parametrize("mode", ["wait", "poll"])
+def test_execution_is_wall_time(standin, mode):
+    """A sleeping submission's wall time counts as execution, not queue time."""
+    job = {
+        "language": "python",
+        "problem_id": 1,
+        "testcase_id": "T1",
+        "payload": {"language_id": 71, "source_code": "import time\ntime.sleep(0.3)", "stdin": ""},
+    }
+    sample = run_job(Judge0Client(standin.url), job, mode, poll_interval=0.02)
+    assert sample["execution"] >= 0.3
+    assert sample["queue"] < sample["execution"]
+
+
+def test_standin_honours_fields(standin):
+    payload = {"language_id": 54, "source_code": "int main() {}"}
+    result = Judge0Client(standin.url).submit_wait(payload, fields=["status", "wall_time"])
+    assert set(result) == {"status", "wall_time"}
+    assert float(result["wall_time"]) >= standin.simulated_time
+
+
+@pytest.mark.parametrize("path, body, field", [
+    ("/submissions", {"language_id": [71], "source_code": "print(1)"}, "language_id"),
+    ("/submissions", {"language_id": {"id": 71}, "source_code": "print(1)"}, "language_id"),
+    ("/submissions", {"language_id": True, "source_code": "print(1)"}, "language_id"),
+    ("/submissions", {"language_id": 71, "source_code": ["print(1)"]}, "source_code"),
+    ("/submissions", {"language_id": 71, "source_code": "print(1)", "stdin": 5}, "stdin"),
+    ("/submissions", [1], "base"),
+    ("/submissions/batch", {"submissions": 5}, "submissions"),
+    ("/submissions/batch", {"submissions": {"a": 1}}, "submissions"),
+])
+def test_standin_rejects_malformed_payloads(standin, path, body, field):
+    """Well-formed JSON of the wrong shape gets a 422, not a dropped connection."""
+    r = requests.post(f"{standin.url}{path}", json=body)
+    assert r.status_code == 422
+    assert field in r.json()
+
+
+def test_cli_writes_json_report(tmp_path):
+    out = tmp_path / "report.json"
+    main(["--standin", "--submissions", "4", "--concurrency", "2", "--output", str(out)])
+    report = json.loads(out.read_text())
+    assert report["config"]["url"] == "standin"
+    assert report["submissions"] == 4
@@ -0,0 +1,122 @@
+# tests/test_judge0_warmpool.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from judge0_tools.client import Judge0Client
+from judge0_tools.sandbox import run_python
+from judge0_tools.standin import StandinJudge0
+from judge0_tools.warmpool import WarmPool, benchmark
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with WarmPool(size=2, time_limit=1) as pool:
+        yield pool
+
+
+DATACLASS_CLASSVAR = """\
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import ClassVar
+
+@dataclass
+class P:
+    x: ClassVar[int] = 1
+    y: int = 2
+
+print(P())
+"""
+
+THREAD_AND_ATEXIT = """\
+import atexit, threading, time
+atexit.register(print, "atexit")
+def late():
+    time.sleep(0.05)
+    print("thread")
+threading.Thread(target=late).start()
+"""
+
+
+@pytest.mark.parametrize("source, stdin, expected, status_id", [
+    ("a, b = map(int, input().split())\nprint(a + b)", "2 3", "5", 3),
+    ("print(input())", "hello", "bye", 4),
+    ("print(1 / 0)", "", None, 11),
+    ("import sys\nsys.exit(3)", "", None, 11),
+    ("import pickle\nclass A: pass\nprint(len(pickle.dumps(A())) > 0)", "", "True", 3),
+    (DATACLASS_CLASSVAR, "", "P(y=2)", 3),
+    (THREAD_AND_ATEXIT, "", "thread\natexit", 3),
+    ("import sys\nprint(sys.argv, sorted(globals()))", "", None, 3),
+    pytest.param("x = 0\n" + "x += 1\n" * 40000 + "print(x)", "", "40000", 3, id="source-over-128KB"),
+])
+def test_same_verdicts_as_cold_start(pool, source, stdin, expected, status_id):
+    warm = pool.run(source, stdin, expected)
+    cold = run_python(source, stdin, expected)
+    assert warm["status"]["id"] == cold["status"]["id"] == status_id
+    for key in ("stdout", "stderr", "message", "exit_code"):
+        assert warm[key] == cold[key]
+    assert float(warm["time"]) >= 0 and warm["memory"] > 0
+
+
+def test_runs_as_main_and_reports_tracebacks(pool):
+    result = pool.run("print(__name__, open(0).read())", "in")
+    assert result["stdout"] == "__main__ in\n"
+    result = pool.run("raise ValueError('boom')")
+    assert result["stderr"].endswith("ValueError: boom\n")
+    assert "warmpool" not in result["stderr"]
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_workers_inherit_only_standard_fds(pool):
+    source = "import os\nprint(sorted(os.listdir('/proc/self/fd')))"
+    assert pool.run(source)["stdout"] == run_python(source)["stdout"] == "['0', '1', '2', '3']\n"
+
+
+def test_workers_are_single_use(pool):
+    """State a submission leaves behind is gone for the next one."""
+    pool.run("import builtins\nbuiltins.leaked = 1")
+    result = pool.run("import builtins\nprint(hasattr(builtins, 'leaked'))")
+    assert result["stdout"] == "False\n"
+
+
+def test_time_limit_kills_busy_and_sleeping_workers(pool):
+    busy = pool.run("while True: pass", time_limit=0.2)
+    assert busy["status"]["id"] == 5
+    assert float(busy["time"]) < 1
+    asleep = pool.run("import time\ntime.sleep(10)", time_limit=0.2)
+    assert asleep["status"]["id"] == 5
+    assert pool.run("print('still ok')")["status"]["id"] == 3
+
+
+def test_size_bounds_concurrent_runs(pool):
+    """Submissions beyond `size` wait for a worker instead of forking more."""
+    source = "import time\nprint(time.time())\ntime.sleep(0.2)\nprint(time.time())"
+    with ThreadPoolExecutor(max_workers=6) as threads:
+        results = list(threads.map(lambda _: pool.run(source), range(6)))
+    spans = [tuple(map(float, r["stdout"].split())) for r in results]
+    overlap = max(sum(1 for s, e in spans if s <= t < e) for t, _ in spans)
+    assert overlap <= pool.size
+
+
+def test_closed_pool_refuses_work():
+    pool = WarmPool(size=1)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.run("print(1)")
+
+
+def test_standin_executes_on_warm_pool(pool):
+    with StandinJudge0(workers=2, executor=pool.run) as judge:
+        result = Judge0Client(judge.url).submit_wait(
+            {"language_id": 71, "source_code": "print(int(input()) * 2)", "stdin": "21", "expected_output": "42"}
+        )
+    assert result["status"]["description"] == "Accepted"
+    assert result["stdout"] == "42\n"
+
+
+def test_benchmark_compares_cold_and_warm():
+    report = benchmark(runs=6, size=2)
+    assert set(report) >= {"cold", "warm", "p50_speedup"}
+    assert report["cold"]["statuses"] == report["warm"]["statuses"]
+    assert report["warm"]["latency_s"]["p50"] < report["cold"]["latency_s"]["p50"]